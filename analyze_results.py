@@ -3,22 +3,179 @@
 Analyze benchmark results and generate visualizations.
 """
 
+import gzip
+import io
 import json
+import math
 import sys
 from pathlib import Path
-from statistics import mean, stdev
-from typing import Dict, List
+from typing import Dict, Optional, TextIO
+
+import numpy as np
+
+try:
+    import ijson
+except ImportError:  # optional; fall back to loading the whole file with json
+    ijson = None
+
+def _reduce_groups_numpy(values: np.ndarray, offsets: np.ndarray):
+    """Mean/min/max/stdev of each values[offsets[g]:offsets[g + 1]] group."""
+    groups = len(offsets) - 1
+    means = np.empty(groups)
+    mins = np.empty(groups)
+    maxs = np.empty(groups)
+    stdevs = np.zeros(groups)
+    for g in range(groups):
+        group = values[offsets[g]:offsets[g + 1]]
+        means[g] = group.mean()
+        mins[g] = group.min()
+        maxs[g] = group.max()
+        if len(group) > 1:
+            stdevs[g] = group.std(ddof=1)
+    return means, mins, maxs, stdevs
+
+
+def _reduce_groups_welford(values, offsets):
+    """One Welford pass per group; same results as _reduce_groups_numpy, compiled with numba."""
+    groups = len(offsets) - 1
+    means = np.empty(groups)
+    mins = np.empty(groups)
+    maxs = np.empty(groups)
+    stdevs = np.zeros(groups)
+    for g in range(groups):
+        start = offsets[g]
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        lo = values[start]
+        hi = values[start]
+        for i in range(start, offsets[g + 1]):
+            x = values[i]
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+            lo = min(lo, x)
+            hi = max(hi, x)
+        means[g] = mean
+        mins[g] = lo
+        maxs[g] = hi
+        if count > 1:
+            stdevs[g] = np.sqrt(m2 / (count - 1))
+    return means, mins, maxs, stdevs
+
+
+_reduce_groups = None
+
+
+def get_reduce_groups():
+    """Pick the group reducer on first use: numba-compiled when installed, else NumPy.
+    
+    Importing numba and compiling is deferred to here so runs that never reduce
+    anything don't pay for it; cache=True reuses the compiled kernel across runs.
+    """
+    global _reduce_groups
+    if _reduce_groups is None:
+        try:
+            import numba
+        except ImportError:  # optional; fall back to per-group NumPy reductions
+            _reduce_groups = _reduce_groups_numpy
+        else:
+            _reduce_groups = numba.njit(fastmath=True, cache=True)(_reduce_groups_welford)
+    return _reduce_groups
+
+
+class RunningStats:
+    """Single-pass mean/min/max/stdev accumulator using Welford's algorithm."""
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+    
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0
+
+
+class ToolStats:
+    """Running reduction of one tool's runs into the shape returned by analyze_results."""
+    
+    def __init__(self):
+        self.total_runs = 0
+        self.cached_runs = 0
+        self.times = RunningStats()
+        self.sizes = RunningStats()
+    
+    def add(self, run: Dict):
+        self.total_runs += 1
+        if run.get("cached"):
+            self.cached_runs += 1
+        if run.get("success"):
+            self.times.add(run["install_time"])
+            self.sizes.add(run["lock_file_size"])
+    
+    def summary(self) -> Dict:
+        if not self.times.count:
+            return {
+                "status": "FAILED",
+                "successful_runs": 0,
+                "total_runs": self.total_runs
+            }
+        
+        return {
+            "status": "SUCCESS",
+            "successful_runs": self.times.count,
+            "total_runs": self.total_runs,
+            "cached_runs": self.cached_runs,
+            "install_time": {
+                "mean": self.times.mean,
+                "min": self.times.min,
+                "max": self.times.max,
+                "stdev": self.times.stdev
+            },
+            "lock_file_size": {
+                "mean": self.sizes.mean,
+                "min": int(self.sizes.min),
+                "max": int(self.sizes.max),
+                "unit": "bytes"
+            }
+        }
+
+
+# Only these fields of each run record are kept while streaming
+STREAMED_FIELDS = {"install_time", "lock_file_size", "success", "cached"}
+
+
+def open_results(results_file: str):
+    """Open a results file for binary reading, decompressing .gz files."""
+    if results_file.endswith(".gz"):
+        return gzip.open(results_file, "rb")
+    return open(results_file, "rb")
 
 
 def load_results(results_file: str) -> Dict:
     """Load results from JSON file."""
-    with open(results_file) as f:
+    with open_results(results_file) as f:
         return json.load(f)
 
 
 def analyze_results(results: Dict) -> Dict:
     """Analyze benchmark results."""
     analysis = {}
+    successful_runs = {}
     
     for tool, runs in results.items():
         successful = [r for r in runs if r["success"]]
@@ -31,35 +188,81 @@ def analyze_results(results: Dict) -> Dict:
             }
             continue
         
-        times = [r["install_time"] for r in successful]
-        sizes = [r["lock_file_size"] for r in successful]
+        successful_runs[tool] = successful
+    
+    if successful_runs:
+        # Lay every tool's runs out back to back and reduce all groups in one call
+        counts = [len(successful) for successful in successful_runs.values()]
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        flat = [r for successful in successful_runs.values() for r in successful]
+        times = np.fromiter((r["install_time"] for r in flat), dtype=np.float64, count=len(flat))
+        sizes = np.fromiter((r["lock_file_size"] for r in flat), dtype=np.float64, count=len(flat))
         
-        analysis[tool] = {
-            "status": "SUCCESS",
-            "successful_runs": len(successful),
-            "total_runs": len(runs),
-            "install_time": {
-                "mean": mean(times),
-                "min": min(times),
-                "max": max(times),
-                "stdev": stdev(times) if len(times) > 1 else 0
-            },
-            "lock_file_size": {
-                "mean": mean(sizes),
-                "min": min(sizes),
-                "max": max(sizes),
-                "unit": "bytes"
+        reduce_groups = get_reduce_groups()
+        time_means, time_mins, time_maxs, time_stdevs = reduce_groups(times, offsets)
+        size_means, size_mins, size_maxs, _ = reduce_groups(sizes, offsets)
+        
+        for g, (tool, successful) in enumerate(successful_runs.items()):
+            analysis[tool] = {
+                "status": "SUCCESS",
+                "successful_runs": len(successful),
+                "total_runs": len(results[tool]),
+                "cached_runs": sum(bool(r.get("cached")) for r in results[tool]),
+                "install_time": {
+                    "mean": float(time_means[g]),
+                    "min": float(time_mins[g]),
+                    "max": float(time_maxs[g]),
+                    "stdev": float(time_stdevs[g])
+                },
+                "lock_file_size": {
+                    "mean": float(size_means[g]),
+                    "min": int(size_mins[g]),
+                    "max": int(size_maxs[g]),
+                    "unit": "bytes"
+                }
             }
-        }
     
-    return analysis
+    # Keep the tools in results order for printing
+    return {tool: analysis[tool] for tool in results}
+
+
+def analyze_results_streaming(results_file: str) -> Dict:
+    """Analyze a results file in one streaming pass without loading it into memory.
+    
+    Each run record is folded into its tool's running statistics as soon as
+    it ends, so only the current record is held in memory.
+    """
+    stats: Dict[str, ToolStats] = {}
+    tool_stats = None
+    item_prefix = None
+    run = None
+    
+    with open_results(results_file) as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == "" and event == "map_key":
+                tool_stats = stats[value] = ToolStats()
+                item_prefix = f"{value}.item"
+            elif prefix == item_prefix:
+                if event == "start_map":
+                    run = {}
+                elif event == "end_map":
+                    tool_stats.add(run)
+                    run = None
+            elif run is not None and event != "map_key":
+                field = prefix[len(item_prefix) + 1:]
+                if field in STREAMED_FIELDS:
+                    run[field] = value
+    
+    return {tool: tool_stats.summary() for tool, tool_stats in stats.items()}
 
 
-def print_analysis(analysis: Dict):
+def print_analysis(analysis: Dict, buf: Optional[TextIO] = None):
     """Print analysis in a readable format."""
-    print("\n" + "="*80)
-    print("📊 DETAILED BENCHMARK ANALYSIS")
-    print("="*80 + "\n")
+    lines = []
+    lines.append("\n" + "="*80)
+    lines.append("📊 DETAILED BENCHMARK ANALYSIS")
+    lines.append("="*80 + "\n")
     
     # Find fastest tool
     successful_tools = {
@@ -72,49 +275,51 @@ def print_analysis(analysis: Dict):
             successful_tools.items(),
             key=lambda x: x[1]["install_time"]["mean"]
         )
-        print(f"⚡ Fastest Tool: {fastest_tool[0].upper()} ({fastest_tool[1]['install_time']['mean']:.2f}s)\n")
+        lines.append(f"⚡ Fastest Tool: {fastest_tool[0].upper()} ({fastest_tool[1]['install_time']['mean']:.2f}s)\n")
     
     for tool, data in analysis.items():
-        print(f"{'='*40}")
-        print(f"🔧 {tool.upper()}")
-        print(f"{'='*40}")
+        lines.append(f"{'='*40}")
+        lines.append(f"🔧 {tool.upper()}")
+        lines.append(f"{'='*40}")
         
         if data["status"] == "FAILED":
-            print(f"❌ Status: FAILED")
-            print(f"   Successful runs: {data['successful_runs']}/{data['total_runs']}")
-            print()
+            lines.append(f"❌ Status: FAILED")
+            lines.append(f"   Successful runs: {data['successful_runs']}/{data['total_runs']}")
+            lines.append("")
             continue
         
-        print(f"✅ Status: SUCCESS")
-        print(f"   Successful runs: {data['successful_runs']}/{data['total_runs']}")
-        print()
+        lines.append(f"✅ Status: SUCCESS")
+        lines.append(f"   Successful runs: {data['successful_runs']}/{data['total_runs']}")
+        if data["cached_runs"]:
+            lines.append(f"   Cached runs:     {data['cached_runs']}/{data['total_runs']} (from an earlier benchmark)")
+        lines.append("")
         
         # Installation time
         time_data = data["install_time"]
-        print(f"⏱️  Installation Time:")
-        print(f"   Mean:   {time_data['mean']:.2f}s")
-        print(f"   Min:    {time_data['min']:.2f}s")
-        print(f"   Max:    {time_data['max']:.2f}s")
+        lines.append(f"⏱️  Installation Time:")
+        lines.append(f"   Mean:   {time_data['mean']:.2f}s")
+        lines.append(f"   Min:    {time_data['min']:.2f}s")
+        lines.append(f"   Max:    {time_data['max']:.2f}s")
         if time_data['stdev'] > 0:
-            print(f"   StdDev: {time_data['stdev']:.2f}s")
-        print()
+            lines.append(f"   StdDev: {time_data['stdev']:.2f}s")
+        lines.append("")
         
         # Lock file size
         size_data = data["lock_file_size"]
         size_kb = size_data["mean"] / 1024
-        print(f"📦 Lock File Size:")
-        print(f"   Mean: {size_kb:.1f}KB ({size_data['mean']:.0f} bytes)")
-        print(f"   Min:  {size_data['min']/1024:.1f}KB")
-        print(f"   Max:  {size_data['max']/1024:.1f}KB")
-        print()
+        lines.append(f"📦 Lock File Size:")
+        lines.append(f"   Mean: {size_kb:.1f}KB ({size_data['mean']:.0f} bytes)")
+        lines.append(f"   Min:  {size_data['min']/1024:.1f}KB")
+        lines.append(f"   Max:  {size_data['max']/1024:.1f}KB")
+        lines.append("")
     
     # Comparison table
-    print("\n" + "="*80)
-    print("📈 COMPARISON TABLE")
-    print("="*80 + "\n")
+    lines.append("\n" + "="*80)
+    lines.append("📈 COMPARISON TABLE")
+    lines.append("="*80 + "\n")
     
-    print(f"{'Tool':<12} {'Time (s)':<15} {'Lock Size (KB)':<15} {'Status':<10}")
-    print("-" * 52)
+    lines.append(f"{'Tool':<12} {'Time (s)':<15} {'Lock Size (KB)':<15} {'Status':<10}")
+    lines.append("-" * 52)
     
     for tool, data in sorted(analysis.items()):
         if data["status"] == "SUCCESS":
@@ -126,19 +331,22 @@ def print_analysis(analysis: Dict):
             size_str = "N/A"
             status = "❌"
         
-        print(f"{tool:<12} {time_str:<15} {size_str:<15} {status:<10}")
+        lines.append(f"{tool:<12} {time_str:<15} {size_str:<15} {status:<10}")
     
-    print()
+    lines.append("")
+    (buf or sys.stdout).write("\n".join(lines) + "\n")
 
 
-def generate_speedup_comparison(analysis: Dict):
+def generate_speedup_comparison(analysis: Dict, buf: Optional[TextIO] = None):
     """Generate speedup comparison relative to pip."""
-    print("\n" + "="*80)
-    print("🚀 SPEEDUP COMPARISON (relative to pip)")
-    print("="*80 + "\n")
+    lines = []
+    lines.append("\n" + "="*80)
+    lines.append("🚀 SPEEDUP COMPARISON (relative to pip)")
+    lines.append("="*80 + "\n")
     
     if "pip" not in analysis or analysis["pip"]["status"] != "SUCCESS":
-        print("⚠️  pip benchmark not available for comparison\n")
+        lines.append("⚠️  pip benchmark not available for comparison\n")
+        (buf or sys.stdout).write("\n".join(lines) + "\n")
         return
     
     pip_time = analysis["pip"]["install_time"]["mean"]
@@ -151,17 +359,18 @@ def generate_speedup_comparison(analysis: Dict):
         speedup = pip_time / tool_time
         
         if speedup > 1:
-            print(f"✨ {tool.upper()}: {speedup:.1f}x faster than pip")
+            lines.append(f"✨ {tool.upper()}: {speedup:.1f}x faster than pip")
         else:
-            print(f"⚠️  {tool.upper()}: {1/speedup:.1f}x slower than pip")
+            lines.append(f"⚠️  {tool.upper()}: {1/speedup:.1f}x slower than pip")
     
-    print()
+    lines.append("")
+    (buf or sys.stdout).write("\n".join(lines) + "\n")
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python analyze_results.py <results_file.json>")
-        print("\nExample: python analyze_results.py results/benchmark_20231115_143022.json")
+        print("Usage: python analyze_results.py <results_file.json[.gz]>")
+        print("\nExample: python analyze_results.py results/benchmark_20231115_143022.json.gz")
         sys.exit(1)
     
     results_file = sys.argv[1]
@@ -170,11 +379,16 @@ def main():
         print(f"❌ Results file not found: {results_file}")
         sys.exit(1)
     
-    results = load_results(results_file)
-    analysis = analyze_results(results)
+    if ijson is not None:
+        analysis = analyze_results_streaming(results_file)
+    else:
+        analysis = analyze_results(load_results(results_file))
     
-    print_analysis(analysis)
-    generate_speedup_comparison(analysis)
+    # Build the whole report in memory and write it to stdout once
+    buf = io.StringIO()
+    print_analysis(analysis, buf)
+    generate_speedup_comparison(analysis, buf)
+    sys.stdout.write(buf.getvalue())
 
 
 if __name__ == "__main__":
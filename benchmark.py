@@ -6,15 +6,96 @@ Measures installation time, lock file size, and memory usage.
 
 import os
 import sys
+import gzip
 import json
+import math
+import importlib
 import time
+import hashlib
 import shutil
 import subprocess
+import uuid
 import argparse
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass, asdict
-from typing import Optional, List
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, List
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used instead
+    orjson = None
+
+# Buffer size for files written by the benchmark (freeze output, results JSON)
+IO_BUFFER_SIZE = 64 * 1024
+
+# Deletes renamed test directories in the background, off the timed path
+_rmtree_executor = ThreadPoolExecutor(max_workers=2)
+_pending_deletes: List[Future] = []
+# Set in benchmark worker processes: they only rename, the parent deletes after the pool
+_defer_deletes = False
+
+
+def _async_rmtree(path: Path):
+    """Rename a directory out of the way and delete it in the background."""
+    if not path.exists():
+        return
+    tmp = path.with_name(f"{path.name}.del.{os.getpid()}.{uuid.uuid4().hex}")
+    path.rename(tmp)
+    if not _defer_deletes:
+        _pending_deletes.append(_rmtree_executor.submit(shutil.rmtree, tmp, ignore_errors=True))
+
+
+def _wait_for_deletes():
+    """Block until background deletes finish so they can't overlap a timed command."""
+    for future in _pending_deletes:
+        future.result()
+    _pending_deletes.clear()
+
+
+def _delete_renamed(root: str):
+    """Background-delete test directories that worker processes renamed but left behind."""
+    for path in Path(root).glob("test_*_run*.del.*"):
+        _pending_deletes.append(_rmtree_executor.submit(shutil.rmtree, path, ignore_errors=True))
+
+
+# pip's install command, created and warmed up once per process by _load_pip_install_command
+_pip_install_command = None
+
+
+def _load_pip_install_command(warmup_args: List[str]) -> tuple[object, int]:
+    """Return pip's install command and the status of its warm-up (0 after the first call).
+    
+    pip imports much of itself lazily during its first install. One untimed
+    `install --dry-run` loads whatever the installed pip version needs, so the
+    first timed run doesn't include those imports.
+    """
+    global _pip_install_command
+    if _pip_install_command is not None:
+        return _pip_install_command, 0
+    install_command = importlib.import_module("pip._internal.commands").create_command("install")
+    status = install_command.main(warmup_args)
+    _pip_install_command = install_command
+    return install_command, status
+
+
+def _encode_json(data, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON: compact by default, indented for humans."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2).encode()
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _init_worker():
+    """Defer deletes in benchmark workers so they never overlap another worker's timed run."""
+    global _defer_deletes
+    _defer_deletes = True
+    # Futures copied from a forked parent have no executor thread here to complete them
+    _pending_deletes.clear()
 
 
 @dataclass
@@ -28,26 +109,75 @@ class BenchmarkResult:
     success: bool
     error_message: Optional[str] = None
     timestamp: str = ""
+    parallelism: int = 1
+    cache_mode: Optional[str] = None
+    timing_source: str = "perf_counter"
+    env_mode: Optional[str] = None
+    cached: bool = False
     
     def __post_init__(self):
         if not self.timestamp:
             self.timestamp = datetime.now().isoformat()
 
 
+def _summarize(results: List[BenchmarkResult], field: str) -> tuple[float, float, float]:
+    """Mean, min and max of one numeric field, in a single pass without building a list."""
+    total = 0.0
+    lo = math.inf
+    hi = -math.inf
+    for r in results:
+        value = getattr(r, field)
+        total += value
+        lo = value if value < lo else lo
+        hi = value if value > hi else hi
+    return total / len(results), lo, hi
+
+
+# (cache name, per-run function, optional setup returning an error message)
+Job = tuple[str, Callable[[int], BenchmarkResult], Optional[Callable[[], Optional[str]]]]
+
+
 class PackageManagerBenchmark:
-    def __init__(self, packages_file: str = "packages.txt", runs: int = 3, verbose: bool = False):
+    def __init__(self, packages_file: str = "packages.txt", runs: int = 3, verbose: bool = False,
+                 workers: int = 1, isolated: bool = False, cache_mode: Optional[str] = None,
+                 use_cache: bool = True, cache_only: bool = False, fast_venv: bool = False,
+                 pip_in_process: bool = False):
         self.packages_file = packages_file
         self.runs = runs
         self.verbose = verbose
+        self.workers = workers
+        self.isolated = isolated
+        # An isolated run starts with an empty pip cache, so it can only be cold
+        if cache_mode is None:
+            cache_mode = "cold" if isolated else "warm"
+        elif isolated and cache_mode == "warm":
+            raise ValueError("isolated runs start with an empty pip cache; cache_mode 'warm' can't apply")
+        self.cache_mode = cache_mode
+        self.use_cache = use_cache
+        self.cache_only = cache_only
+        if pip_in_process and fast_venv:
+            raise ValueError("pip_in_process installs without a venv, so fast_venv can't apply")
+        if pip_in_process:
+            self.env_mode = "in-process"
+        else:
+            self.env_mode = "template" if fast_venv else "venv"
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.tool_versions: Dict[str, str] = {}
         self.results_dir = Path("results")
         self.results_dir.mkdir(exist_ok=True)
+        self.cache_dir = self.results_dir / ".cache"
+        self.template_venv = os.path.join(os.path.abspath(self.results_dir), ".venv_template")
         
-        # Load packages
-        with open(packages_file) as f:
-            self.packages = [line.strip() for line in f if line.strip()]
+        # Load packages: one per line; blank lines and # comments are ignored, as is a UTF-8 BOM
+        with open(packages_file, encoding="utf-8-sig") as f:
+            stripped = (line.strip() for line in f.read().splitlines())
+            self.packages = [line for line in stripped if line and not line.startswith("#")]
         
         print(f"📦 Loaded {len(self.packages)} packages from {packages_file}")
         print(f"🔄 Running {runs} iterations per tool")
+        if workers > 1:
+            print(f"⚡ Running up to {workers} benchmark runs concurrently")
         print()
     
     def log(self, message: str, verbose_only: bool = False):
@@ -55,24 +185,43 @@ class PackageManagerBenchmark:
             return
         print(message)
     
-    def _get_file_size(self, path: Path) -> int:
+    def _get_file_size(self, path: str) -> int:
         """Get file size in bytes."""
-        if path.exists():
-            return path.stat().st_size
-        return 0
+        try:
+            return os.stat(path).st_size
+        except FileNotFoundError:
+            return 0
+    
+    def _command_env(self, cwd: str) -> Optional[Dict[str, str]]:
+        """Environment for a command: tool caches point into cwd when isolated, else inherited."""
+        if not self.isolated:
+            return None
+        
+        cache_root = os.path.join(os.path.abspath(cwd), ".cache")
+        return {
+            **os.environ,
+            "PIP_CACHE_DIR": os.path.join(cache_root, "pip"),
+            "POETRY_CACHE_DIR": os.path.join(cache_root, "poetry"),
+            "UV_CACHE_DIR": os.path.join(cache_root, "uv"),
+        }
     
-    def _run_command(self, cmd: List[str], cwd: Path) -> tuple[bool, str, float]:
-        """Run a command and measure execution time."""
+    def _run_command(self, cmd: List[str], cwd: str) -> tuple[bool, str, float]:
+        """Run a command and measure execution time with the monotonic perf_counter clock.
+        
+        No preexec_fn, user/group or similar options are passed, so CPython can
+        start the child with vfork/posix_spawn instead of a full fork.
+        """
         try:
-            start = time.time()
+            start = time.perf_counter()
             result = subprocess.run(
                 cmd,
                 cwd=cwd,
+                env=self._command_env(cwd),
                 capture_output=True,
                 text=True,
                 timeout=300  # 5 minute timeout
             )
-            elapsed = time.time() - start
+            elapsed = time.perf_counter() - start
             
             if result.returncode != 0:
                 error = result.stderr or result.stdout
@@ -84,95 +233,396 @@ class PackageManagerBenchmark:
         except Exception as e:
             return False, str(e), 0
     
-    def benchmark_pip(self) -> List[BenchmarkResult]:
-        """Benchmark pip + venv."""
-        print("🔧 Benchmarking pip + venv...")
-        results = []
-        
-        for run in range(1, self.runs + 1):
-            test_dir = Path(f"test_pip_run{run}")
-            if test_dir.exists():
-                shutil.rmtree(test_dir)
-            test_dir.mkdir()
+    def _run_command_to_file(self, cmd: List[str], cwd: str, stdout_path: str) -> tuple[bool, str, float]:
+        """Run a command with stdout written straight to a file instead of captured."""
+        try:
+            start = time.perf_counter()
+            with open(stdout_path, "wb", buffering=IO_BUFFER_SIZE) as out:
+                result = subprocess.run(
+                    cmd,
+                    cwd=cwd,
+                    env=self._command_env(cwd),
+                    stdout=out,
+                    stderr=subprocess.PIPE,
+                    timeout=300  # 5 minute timeout
+                )
+            elapsed = time.perf_counter() - start
             
+            if result.returncode != 0:
+                os.unlink(stdout_path)
+                return False, result.stderr.decode(errors="replace"), elapsed
+            
+            return True, "", elapsed
+        except subprocess.TimeoutExpired:
+            Path(stdout_path).unlink(missing_ok=True)
+            return False, "Command timed out after 5 minutes", 300
+        except Exception as e:
+            Path(stdout_path).unlink(missing_ok=True)
+            return False, str(e), 0
+    
+    def _version_command(self, tool: str) -> List[str]:
+        """Command printing the version of the tool a benchmark actually runs."""
+        if tool == "pip":
+            if self.env_mode == "in-process":
+                return [sys.executable, "-m", "pip", "--version"]
+            # Fresh venvs get the pip bundled with ensurepip, not the system one
+            return ["python3", "-m", "ensurepip", "--version"]
+        return [tool, "--version"]
+    
+    def _tool_version(self, tool: str) -> str:
+        """Version output of a tool, or "" if it can't be run; looked up once per tool."""
+        if tool not in self.tool_versions:
             try:
-                # Create venv
-                self.log(f"  Run {run}: Creating venv...", verbose_only=True)
-                success, output, _ = self._run_command(
-                    ["python3", "-m", "venv", "venv"],
-                    test_dir
-                )
-                if not success:
-                    results.append(BenchmarkResult(
-                        tool="pip",
-                        run_number=run,
-                        install_time=0,
-                        lock_file_size=0,
-                        lock_file_path="",
-                        packages_count=len(self.packages),
-                        success=False,
-                        error_message=f"Failed to create venv: {output}"
-                    ))
+                result = subprocess.run(self._version_command(tool), capture_output=True, text=True, timeout=60)
+                self.tool_versions[tool] = result.stdout.strip() if result.returncode == 0 else ""
+            except (OSError, subprocess.TimeoutExpired):
+                self.tool_versions[tool] = ""
+        return self.tool_versions[tool]
+    
+    def _cache_key(self, tool: str) -> str:
+        """Content-addressed key for a tool's results on the current package list.
+        
+        Parallelism and cache isolation change timings, so they are part of the key
+        and results from one configuration are never reused by another. So is the
+        tool's version, so upgrading a tool never reports the old version's timings.
+        Cache names are the tool name, optionally followed by "-<configuration>".
+        """
+        version = self._tool_version(tool.split("-", 1)[0])
+        config = f"{tool}|parallelism={self.workers}|isolated={self.isolated}|version={version}"
+        return hashlib.sha256(("\n".join(sorted(self.packages)) + config).encode()).hexdigest()
+    
+    def _cache_file(self, tool: str) -> Path:
+        return self.cache_dir / f"{tool}-{self._cache_key(tool)}.json"
+    
+    def _load_cached(self, tool: str) -> Optional[List[BenchmarkResult]]:
+        """Return cached results covering at least self.runs runs, or None on a miss."""
+        if not self.use_cache:
+            return None
+        
+        cache_file = self._cache_file(tool)
+        cached = []
+        try:
+            with open(cache_file) as f:
+                cached = [BenchmarkResult(**r) for r in json.load(f)]
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, TypeError) as e:
+            # Unreadable or from an incompatible version: treat it as a miss
+            self.log(f"  ⚠️  Ignoring unreadable cache file {cache_file}: {e}", verbose_only=True)
+            cached = []
+        
+        if len(cached) < self.runs:
+            self.cache_misses += 1
+            return None
+        
+        self.cache_hits += 1
+        cached = cached[:self.runs]
+        for r in cached:
+            r.cached = True
+        return cached
+    
+    def _store_cached(self, tool: str, results: List[BenchmarkResult]):
+        """Cache results, unless a run failed (e.g. the tool is not installed yet)."""
+        if not self.use_cache or not results or not all(r.success for r in results):
+            return
+        
+        self.cache_dir.mkdir(exist_ok=True)
+        # Write to a temp file and swap it in, so an interrupted run never leaves a truncated cache
+        cache_file = self._cache_file(tool)
+        tmp = cache_file.with_name(f"{cache_file.name}.tmp.{os.getpid()}")
+        with open(tmp, "w") as f:
+            json.dump([r.__dict__ for r in results], f, indent=2)
+        os.replace(tmp, cache_file)
+    
+    def _benchmark(self, jobs: Dict[str, Job]) -> Dict[str, List[BenchmarkResult]]:
+        """Run each tool's job, reusing cached results where possible.
+        
+        jobs maps a tool name to (cache name, per-run function, setup); the cache name
+        distinguishes configurations of the same tool that give different results.
+        setup, if given, runs once before a tool's runs and only if they aren't
+        cached; it returns an error message if the runs can't go ahead.
+        """
+        all_results = {}
+        pending = {}
+        for tool, (cache_name, runner, setup) in jobs.items():
+            cached = self._load_cached(cache_name)
+            if cached is not None:
+                self.log(f"  ♻️  {tool}: reusing {len(cached)} cached runs")
+                all_results[tool] = cached
+            elif self.cache_only:
+                self.log(f"  ⚠️  {tool}: no cached results for this package list")
+                all_results[tool] = []
+            else:
+                error = setup() if setup is not None else None
+                if error is None:
+                    pending[tool] = runner
                     continue
-                
-                # Install packages
-                self.log(f"  Run {run}: Installing packages...", verbose_only=True)
-                pip_cmd = [
-                    str(test_dir / "venv" / "bin" / "pip"),
-                    "install",
-                    "-q"
-                ] + self.packages
-                
-                success, output, install_time = self._run_command(pip_cmd, test_dir)
-                
-                # Generate requirements.txt
-                req_file = test_dir / "requirements.txt"
-                freeze_cmd = [
-                    str(test_dir / "venv" / "bin" / "pip"),
-                    "freeze"
+                self.log(f"  ⚠️  {tool}: {error}")
+                all_results[tool] = [
+                    self._result(tool, run, False, error_message=error)
+                    for run in range(1, self.runs + 1)
                 ]
-                success_freeze, freeze_output, _ = self._run_command(freeze_cmd, test_dir)
-                
-                if success_freeze:
-                    req_file.write_text(freeze_output)
-                
-                lock_size = self._get_file_size(req_file)
-                
-                result = BenchmarkResult(
-                    tool="pip",
-                    run_number=run,
-                    install_time=install_time,
-                    lock_file_size=lock_size,
-                    lock_file_path=str(req_file),
-                    packages_count=len(self.packages),
-                    success=success,
-                    error_message=None if success else output
-                )
-                results.append(result)
-                self.log(f"  Run {run}: ✅ {install_time:.2f}s | Lock: {lock_size/1024:.1f}KB")
-                
-            finally:
-                if test_dir.exists():
-                    shutil.rmtree(test_dir)
         
-        return results
+        for tool, results in self._map_runs(pending).items():
+            self._store_cached(jobs[tool][0], results)
+            all_results[tool] = results
+        
+        return {tool: all_results[tool] for tool in jobs}
     
-    def benchmark_poetry(self) -> List[BenchmarkResult]:
-        """Benchmark poetry + pyenv."""
-        print("🔧 Benchmarking poetry + pyenv...")
-        results = []
+    def _map_runs(self, runners: Dict[str, Callable[[int], BenchmarkResult]]) -> Dict[str, List[BenchmarkResult]]:
+        """Execute every (tool, run) pair, concurrently when more than one worker is configured."""
+        if self.workers <= 1:
+            return {
+                tool: [runner(run) for run in range(1, self.runs + 1)]
+                for tool, runner in runners.items()
+            }
+        
+        # Finish the parent's deletes first so they can't overlap the workers' timed runs
+        _wait_for_deletes()
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker) as executor:
+            futures = {
+                tool: [executor.submit(runner, run) for run in range(1, self.runs + 1)]
+                for tool, runner in runners.items()
+            }
+            all_results = {
+                tool: [future.result() for future in tool_futures]
+                for tool, tool_futures in futures.items()
+            }
+        
+        _delete_renamed(os.getcwd())
+        return all_results
+    
+    def _result(self, tool: str, run: int, success: bool, install_time: float = 0,
+                lock_file_path: str = "", lock_file_size: int = 0,
+                error_message: Optional[str] = None) -> BenchmarkResult:
+        """Build one run's BenchmarkResult, filling in the benchmark-wide settings."""
+        return BenchmarkResult(
+            tool=tool,
+            run_number=run,
+            install_time=install_time,
+            lock_file_size=lock_file_size,
+            lock_file_path=lock_file_path,
+            packages_count=len(self.packages),
+            success=success,
+            error_message=error_message,
+            parallelism=self.workers,
+            # Only pip's runs depend on these settings
+            cache_mode=self.cache_mode if tool == "pip" else None,
+            env_mode=self.env_mode if tool == "pip" else None
+        )
+    
+    def _pip_install_args(self) -> List[str]:
+        """Options for `pip install`, shared by the venv and in-process pip runs."""
+        args = [
+            "-q",
+            "-U",
+            "--no-input",
+            "--progress-bar=off",
+            "--retries", "1",
+            "--disable-pip-version-check"
+        ]
+        if self.cache_mode == "cold":
+            args.append("--no-cache-dir")
+        return args
+    
+    def _layout(self, tool: str, run: int) -> Dict[str, str]:
+        """Absolute paths used by one run, joined once before any timing starts."""
+        test_dir = os.path.join(os.getcwd(), f"test_{tool}_run{run}")
+        venv = os.path.join(test_dir, "venv")
+        return {
+            "test_dir": test_dir,
+            "venv": venv,
+            "venv_python": os.path.join(venv, "bin", "python"),
+            "req_file": os.path.join(test_dir, "requirements.txt"),
+            "pyproject": os.path.join(test_dir, "pyproject.toml"),
+            "poetry_lock": os.path.join(test_dir, "poetry.lock"),
+            "uv_lock": os.path.join(test_dir, "uv.lock"),
+            "target": os.path.join(test_dir, "target"),
+        }
+    
+    def _venv_python_version(self) -> str:
+        """Version of the python3 that creates venvs, in the form pyvenv.cfg records it."""
+        try:
+            result = subprocess.run(
+                ["python3", "-c", "import platform; print(platform.python_version())"],
+                capture_output=True, text=True, timeout=60
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return ""
+        return result.stdout.strip()
+    
+    def _template_version(self) -> Optional[str]:
+        """Python version recorded in the template venv's pyvenv.cfg, or None if it has none."""
+        try:
+            with open(os.path.join(self.template_venv, "pyvenv.cfg")) as f:
+                for line in f:
+                    key, _, value = line.partition("=")
+                    if key.strip() == "version":
+                        return value.strip()
+        except FileNotFoundError:
+            pass
+        return None
+    
+    def _ensure_template_venv(self) -> Optional[str]:
+        """Create the venv that --fast-venv runs copy, unless a complete, current one exists.
+        
+        A template is reused only if it has an interpreter and was built by the same
+        python3 version that would build it now. It is built in a temporary directory
+        and renamed into place only once `python3 -m venv` succeeds, so an interrupted
+        build is never reused. Returns an error message on failure.
+        """
+        template = self.template_venv
+        version = self._venv_python_version()
+        if os.path.exists(os.path.join(template, "bin", "python")) and self._template_version() == version:
+            return None
+        if os.path.exists(template):
+            self.log("  Removing incomplete or outdated template venv...", verbose_only=True)
+            shutil.rmtree(template)
         
-        for run in range(1, self.runs + 1):
-            test_dir = Path(f"test_poetry_run{run}")
-            if test_dir.exists():
-                shutil.rmtree(test_dir)
-            test_dir.mkdir()
+        self.log("  Creating template venv...", verbose_only=True)
+        tmp = f"{template}.tmp.{os.getpid()}"
+        if os.path.exists(tmp):
+            shutil.rmtree(tmp)
+        success, output, _ = self._run_command(
+            ["python3", "-m", "venv", tmp],
+            str(self.results_dir)
+        )
+        if not success:
+            shutil.rmtree(tmp, ignore_errors=True)
+            return f"Failed to create template venv: {output}"
+        os.rename(tmp, template)
+        return None
+    
+    def _create_venv(self, venv: str, cwd: str) -> tuple[bool, str]:
+        """Create a run's venv, hardlinking the template instead of running venv with --fast-venv.
+        
+        Scripts in a copied venv still point at the template's interpreter, so
+        pip is always invoked as venv/bin/python -m pip.
+        """
+        if self.env_mode == "template":
+            try:
+                shutil.copytree(self.template_venv, venv, symlinks=True, copy_function=os.link)
+                return True, ""
+            except OSError as e:
+                return False, str(e)
+        
+        success, output, _ = self._run_command(["python3", "-m", "venv", venv], cwd)
+        return success, output
+    
+    def _run_single_pip(self, run: int) -> BenchmarkResult:
+        """Run a single pip + venv installation."""
+        layout = self._layout("pip", run)
+        cwd = layout["test_dir"]
+        test_dir = Path(cwd)
+        _async_rmtree(test_dir)
+        test_dir.mkdir()
+        
+        try:
+            # Create venv
+            self.log(f"  pip run {run}: Creating venv...", verbose_only=True)
+            success, output = self._create_venv(layout["venv"], cwd)
+            if not success:
+                return self._result("pip", run, False, error_message=f"Failed to create venv: {output}")
+            
+            # Install packages
+            self.log(f"  pip run {run}: Installing packages...", verbose_only=True)
+            pip_cmd = [layout["venv_python"], "-m", "pip", "install"] + self._pip_install_args() + self.packages
+            
+            _wait_for_deletes()
+            success, output, install_time = self._run_command(pip_cmd, cwd)
+            
+            # Generate requirements.txt
+            req_file = layout["req_file"]
+            freeze_cmd = [
+                layout["venv_python"],
+                "-m", "pip",
+                "freeze",
+                "--disable-pip-version-check"
+            ]
+            self._run_command_to_file(freeze_cmd, cwd, req_file)
+            
+            lock_size = self._get_file_size(req_file)
             
+            result = self._result(
+                "pip", run, success, install_time, req_file, lock_size,
+                error_message=None if success else output
+            )
+            self.log(f"  pip run {run}: ✅ {install_time:.2f}s | Lock: {lock_size/1024:.1f}KB")
+            return result
+            
+        finally:
+            _async_rmtree(test_dir)
+    
+    def _run_single_pip_in_process(self, run: int) -> BenchmarkResult:
+        """Run a single pip installation inside this interpreter, into a --target directory.
+        
+        Interpreter startup and pip's imports happen before the timer starts, so
+        only the install itself is measured; this gives up venv isolation, as the
+        benchmark's own pip is used.
+        """
+        layout = self._layout("pip", run)
+        cwd = layout["test_dir"]
+        test_dir = Path(cwd)
+        _async_rmtree(test_dir)
+        test_dir.mkdir()
+        
+        try:
+            target = layout["target"]
+            warmup_args = self._pip_install_args() + ["--dry-run", "--target", target] + self.packages[:1]
             try:
-                # Create pyproject.toml
-                self.log(f"  Run {run}: Creating project...", verbose_only=True)
-                pyproject = test_dir / "pyproject.toml"
-                pyproject.write_text("""[tool.poetry]
+                install_command, warmup_status = _load_pip_install_command(warmup_args)
+            except ImportError as e:
+                return self._result("pip", run, False, error_message=f"Failed to import pip: {e}")
+            if warmup_status != 0:
+                self.log(f"  ⚠️  pip warm-up exited with status {warmup_status}; "
+                         f"pip run {run} may include pip's first-use imports")
+            
+            # Install packages
+            self.log(f"  pip run {run}: Installing packages in-process...", verbose_only=True)
+            pip_args = self._pip_install_args() + ["--target", target] + self.packages
+            
+            _wait_for_deletes()
+            start = time.perf_counter()
+            returncode = install_command.main(pip_args)
+            install_time = time.perf_counter() - start
+            success = returncode == 0
+            
+            # Generate requirements.txt
+            req_file = layout["req_file"]
+            freeze_cmd = [
+                sys.executable,
+                "-m", "pip",
+                "freeze",
+                "--disable-pip-version-check",
+                "--path", target
+            ]
+            self._run_command_to_file(freeze_cmd, cwd, req_file)
+            
+            lock_size = self._get_file_size(req_file)
+            
+            result = self._result(
+                "pip", run, success, install_time, req_file, lock_size,
+                error_message=None if success else f"pip exited with status {returncode}"
+            )
+            self.log(f"  pip run {run}: ✅ {install_time:.2f}s | Lock: {lock_size/1024:.1f}KB")
+            return result
+            
+        finally:
+            _async_rmtree(test_dir)
+    
+    def _run_single_poetry(self, run: int) -> BenchmarkResult:
+        """Run a single poetry installation."""
+        layout = self._layout("poetry", run)
+        cwd = layout["test_dir"]
+        test_dir = Path(cwd)
+        _async_rmtree(test_dir)
+        test_dir.mkdir()
+        
+        try:
+            # Create pyproject.toml
+            self.log(f"  poetry run {run}: Creating project...", verbose_only=True)
+            with open(layout["pyproject"], "w") as f:
+                f.write("""[tool.poetry]
 name = "benchmark"
 version = "0.1.0"
 description = ""
@@ -180,161 +630,179 @@ description = ""
 [tool.poetry.dependencies]
 python = "^3.10"
 """)
-                
-                # Add packages
-                self.log(f"  Run {run}: Installing packages...", verbose_only=True)
-                for package in self.packages:
-                    success, output, _ = self._run_command(
-                        ["poetry", "add", "-q", package],
-                        test_dir
-                    )
-                    if not success:
-                        self.log(f"    Warning: Failed to add {package}: {output}", verbose_only=True)
-                
-                # Measure lock file generation
-                lock_file = test_dir / "poetry.lock"
-                start = time.time()
-                success, output, _ = self._run_command(
-                    ["poetry", "lock", "--no-update"],
-                    test_dir
-                )
-                lock_time = time.time() - start
-                
-                lock_size = self._get_file_size(lock_file)
-                
-                result = BenchmarkResult(
-                    tool="poetry",
-                    run_number=run,
-                    install_time=lock_time,
-                    lock_file_size=lock_size,
-                    lock_file_path=str(lock_file),
-                    packages_count=len(self.packages),
-                    success=success,
-                    error_message=None if success else output
-                )
-                results.append(result)
-                self.log(f"  Run {run}: ✅ {lock_time:.2f}s | Lock: {lock_size/1024:.1f}KB")
-                
-            finally:
-                if test_dir.exists():
-                    shutil.rmtree(test_dir)
-        
-        return results
+            
+            # Add all packages in one call so poetry resolves and writes the lock file once
+            self.log(f"  poetry run {run}: Resolving packages...", verbose_only=True)
+            lock_file = layout["poetry_lock"]
+            _wait_for_deletes()
+            success, output, add_time = self._run_command(
+                ["poetry", "add", "-q", "--lock"] + self.packages,
+                cwd
+            )
+            
+            lock_size = self._get_file_size(lock_file)
+            
+            result = self._result(
+                "poetry", run, success, add_time, lock_file, lock_size,
+                error_message=None if success else output
+            )
+            self.log(f"  poetry run {run}: ✅ {add_time:.2f}s | Lock: {lock_size/1024:.1f}KB")
+            return result
+            
+        finally:
+            _async_rmtree(test_dir)
     
-    def benchmark_uv(self, use_requirements_file: bool = False) -> List[BenchmarkResult]:
-        """Benchmark uv."""
-        print("🔧 Benchmarking uv...")
-        results = []
+    def _run_single_uv(self, run: int, use_requirements_file: bool = False) -> BenchmarkResult:
+        """Run a single uv installation."""
+        layout = self._layout("uv", run)
+        cwd = layout["test_dir"]
+        test_dir = Path(cwd)
+        _async_rmtree(test_dir)
+        test_dir.mkdir()
         
-        for run in range(1, self.runs + 1):
-            test_dir = Path(f"test_uv_run{run}")
-            if test_dir.exists():
-                shutil.rmtree(test_dir)
-            test_dir.mkdir()
-            
-            try:
-                if use_requirements_file:
-                    # Use requirements.txt directly
-                    self.log(f"  Run {run}: Creating requirements.txt...", verbose_only=True)
-                    req_file = test_dir / "requirements.txt"
-                    req_file.write_text("\n".join(self.packages))
-                    
-                    self.log(f"  Run {run}: Installing from requirements.txt...", verbose_only=True)
-                    start = time.time()
-                    success, output, _ = self._run_command(
-                        ["uv", "pip", "compile", str(req_file), "-o", "uv.lock"],
-                        test_dir
-                    )
-                    install_time = time.time() - start
-                    
-                    lock_file = test_dir / "uv.lock"
-                else:
-                    # Create pyproject.toml
-                    self.log(f"  Run {run}: Creating project...", verbose_only=True)
-                    pyproject = test_dir / "pyproject.toml"
-                    pyproject.write_text("""[project]
+        try:
+            lock_file = layout["uv_lock"]
+            if use_requirements_file:
+                # Use requirements.txt directly
+                self.log(f"  uv run {run}: Creating requirements.txt...", verbose_only=True)
+                req_file = layout["req_file"]
+                with open(req_file, "w") as f:
+                    f.write("\n".join(self.packages))
+                
+                self.log(f"  uv run {run}: Installing from requirements.txt...", verbose_only=True)
+                _wait_for_deletes()
+                success, output, install_time = self._run_command(
+                    ["uv", "pip", "compile", req_file, "-o", lock_file],
+                    cwd
+                )
+            else:
+                # Create pyproject.toml
+                self.log(f"  uv run {run}: Creating project...", verbose_only=True)
+                with open(layout["pyproject"], "w") as f:
+                    f.write("""[project]
 name = "benchmark"
 version = "0.1.0"
 description = ""
 requires-python = ">=3.10"
 dependencies = []
 """)
-                    
-                    # Install packages and measure time
-                    self.log(f"  Run {run}: Installing packages...", verbose_only=True)
-                    start = time.time()
-                    success, output, _ = self._run_command(
-                        ["uv", "add"] + self.packages,
-                        test_dir
-                    )
-                    install_time = time.time() - start
-                    
-                    lock_file = test_dir / "uv.lock"
-                
-                lock_size = self._get_file_size(lock_file)
                 
-                result = BenchmarkResult(
-                    tool="uv",
-                    run_number=run,
-                    install_time=install_time,
-                    lock_file_size=lock_size,
-                    lock_file_path=str(lock_file),
-                    packages_count=len(self.packages),
-                    success=success,
-                    error_message=None if success else output
+                # Install packages and measure time
+                self.log(f"  uv run {run}: Installing packages...", verbose_only=True)
+                _wait_for_deletes()
+                success, output, install_time = self._run_command(
+                    ["uv", "add"] + self.packages,
+                    cwd
                 )
-                results.append(result)
-                self.log(f"  Run {run}: ✅ {install_time:.2f}s | Lock: {lock_size/1024:.1f}KB")
-                
-            finally:
-                if test_dir.exists():
-                    shutil.rmtree(test_dir)
-        
-        return results
+            
+            lock_size = self._get_file_size(lock_file)
+            
+            result = self._result(
+                "uv", run, success, install_time, lock_file, lock_size,
+                error_message=None if success else output
+            )
+            self.log(f"  uv run {run}: ✅ {install_time:.2f}s | Lock: {lock_size/1024:.1f}KB")
+            return result
+            
+        finally:
+            _async_rmtree(test_dir)
+    
+    def _pip_job(self) -> Job:
+        runner = self._run_single_pip_in_process if self.env_mode == "in-process" else self._run_single_pip
+        setup = self._ensure_template_venv if self.env_mode == "template" else None
+        return f"pip-{self.cache_mode}-{self.env_mode}", runner, setup
+    
+    def _poetry_job(self) -> Job:
+        return "poetry", self._run_single_poetry, None
+    
+    def _uv_job(self, use_requirements_file: bool) -> Job:
+        runner = partial(self._run_single_uv, use_requirements_file=use_requirements_file)
+        return ("uv-compile" if use_requirements_file else "uv"), runner, None
+    
+    def benchmark_pip(self) -> List[BenchmarkResult]:
+        """Benchmark pip + venv."""
+        print("🔧 Benchmarking pip + venv...")
+        return self._benchmark({"pip": self._pip_job()})["pip"]
+    
+    def benchmark_poetry(self) -> List[BenchmarkResult]:
+        """Benchmark poetry + pyenv."""
+        print("🔧 Benchmarking poetry + pyenv...")
+        return self._benchmark({"poetry": self._poetry_job()})["poetry"]
+    
+    def benchmark_uv(self, use_requirements_file: bool = False) -> List[BenchmarkResult]:
+        """Benchmark uv."""
+        print("🔧 Benchmarking uv...")
+        return self._benchmark({"uv": self._uv_job(use_requirements_file)})["uv"]
     
     def run_all(self, uv_use_requirements: bool = False) -> dict:
         """Run all benchmarks."""
-        all_results = {
-            "pip": self.benchmark_pip(),
-            "poetry": self.benchmark_poetry(),
-            "uv": self.benchmark_uv(use_requirements_file=uv_use_requirements)
-        }
+        if self.workers <= 1:
+            all_results = {
+                "pip": self.benchmark_pip(),
+                "poetry": self.benchmark_poetry(),
+                "uv": self.benchmark_uv(use_requirements_file=uv_use_requirements)
+            }
+            return all_results
+        
+        # Submit every (tool, run) pair to one pool so runs overlap across tools too
+        print("🔧 Benchmarking pip + venv, poetry + pyenv and uv concurrently...")
+        all_results = self._benchmark({
+            "pip": self._pip_job(),
+            "poetry": self._poetry_job(),
+            "uv": self._uv_job(uv_use_requirements)
+        })
         return all_results
     
-    def print_summary(self, all_results: dict):
+    def print_summary(self, all_results: dict, pretty: bool = False):
         """Print summary of results."""
         print("\n" + "="*70)
         print("📊 BENCHMARK SUMMARY")
         print("="*70 + "\n")
         
         for tool, results in all_results.items():
+            if not results:
+                print(f"⏭️  {tool.upper()}: No results (not in cache)")
+                continue
+            
             successful = [r for r in results if r.success]
             if not successful:
                 print(f"❌ {tool.upper()}: All runs failed")
                 continue
             
-            times = [r.install_time for r in successful]
-            sizes = [r.lock_file_size for r in successful]
-            
-            avg_time = sum(times) / len(times)
-            avg_size = sum(sizes) / len(sizes)
-            min_time = min(times)
-            max_time = max(times)
+            avg_time, min_time, max_time = _summarize(successful, "install_time")
+            avg_size, _, _ = _summarize(successful, "lock_file_size")
             
             print(f"✅ {tool.upper()}")
             print(f"   Installation Time: {avg_time:.2f}s (min: {min_time:.2f}s, max: {max_time:.2f}s)")
             print(f"   Lock File Size: {avg_size/1024:.1f}KB")
             print(f"   Successful Runs: {len(successful)}/{len(results)}")
+            cached_runs = sum(r.cached for r in results)
+            if cached_runs:
+                print(f"   Cached Runs: {cached_runs}/{len(results)} (from an earlier benchmark)")
+            print()
+        
+        lookups = self.cache_hits + self.cache_misses
+        if lookups:
+            print(f"♻️  Cache Hit Ratio: {self.cache_hits}/{lookups} ({self.cache_hits / lookups:.0%})")
             print()
         
-        # Save detailed results
-        results_file = self.results_dir / f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        # Save detailed results: gzipped compact JSON, or indented plain JSON with --pretty
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # BenchmarkResult is flat, so its __dict__ serializes as-is without asdict's deep copy
         results_data = {
-            tool: [asdict(r) for r in results]
+            tool: [r.__dict__ for r in results]
             for tool, results in all_results.items()
         }
-        with open(results_file, "w") as f:
-            json.dump(results_data, f, indent=2)
+        payload = _encode_json(results_data, pretty=pretty)
+        if pretty:
+            results_file = self.results_dir / f"benchmark_{stamp}.json"
+            with open(results_file, "wb", buffering=IO_BUFFER_SIZE) as f:
+                f.write(payload)
+        else:
+            results_file = self.results_dir / f"benchmark_{stamp}.json.gz"
+            with open(results_file, "wb", buffering=IO_BUFFER_SIZE) as raw, \
+                    gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=3) as f:
+                f.write(payload)
         print(f"📁 Detailed results saved to: {results_file}")
 
 
@@ -344,14 +812,37 @@ def main():
     parser.add_argument("--runs", type=int, default=3, help="Number of runs per tool")
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
     parser.add_argument("--packages", default="packages.txt", help="Path to packages file")
+    parser.add_argument("--pretty", action="store_true", help="Save results as indented plain JSON instead of gzipped compact JSON")
     parser.add_argument("--uv-requirements", action="store_true", help="Use requirements.txt with uv pip compile")
+    parser.add_argument("--parallel", action="store_true", help="Run benchmark runs concurrently, one worker per CPU")
+    parser.add_argument("--isolated", action="store_true", help="Give each run its own pip/poetry/uv cache directory")
+    parser.add_argument("--cache-mode", choices=["cold", "warm"],
+                        help="Benchmark pip with (warm) or without (cold) its download cache "
+                             "(default: warm, or cold with --isolated)")
+    pip_env_group = parser.add_mutually_exclusive_group()
+    pip_env_group.add_argument("--fast-venv", action="store_true",
+                               help="Hardlink-copy a template venv per pip run instead of creating a fresh one")
+    pip_env_group.add_argument("--pip-in-process", action="store_true",
+                               help="Run pip inside the benchmark interpreter into a --target dir (no venv, no interpreter startup)")
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument("--no-cache", action="store_true", help="Ignore and don't write cached benchmark results")
+    cache_group.add_argument("--cache-only", action="store_true", help="Only report cached benchmark results, never run tools")
     
     args = parser.parse_args()
+    if args.isolated and args.cache_mode == "warm":
+        parser.error("--isolated gives every run an empty pip cache, so --cache-mode warm can't apply")
     
     benchmark = PackageManagerBenchmark(
         packages_file=args.packages,
         runs=args.runs,
-        verbose=args.verbose
+        verbose=args.verbose,
+        workers=(os.cpu_count() or 1) if args.parallel else 1,
+        isolated=args.isolated,
+        cache_mode=args.cache_mode,
+        use_cache=not args.no_cache,
+        cache_only=args.cache_only,
+        fast_venv=args.fast_venv,
+        pip_in_process=args.pip_in_process
     )
     
     if args.tool:
@@ -364,7 +855,10 @@ def main():
     else:
         results = benchmark.run_all(uv_use_requirements=args.uv_requirements)
     
-    benchmark.print_summary(results)
+    benchmark.print_summary(results, pretty=args.pretty)
+    
+    # Wait for background deletes so no test directories are left behind
+    _rmtree_executor.shutdown(wait=True)
 
 
 if __name__ == "__main__":